@@ -2,8 +2,7 @@ import streamlit as st
 
 from datetime import datetime
 
-from src.app_state import load_config, load_workforce, load_and_clean_data, get_trained_model, get_predictions, load_field_collection
-from src.planner.scheduler import schedule_field_work
+from src.app_state import load_config, load_workforce, load_and_clean_data, get_predictions, load_field_collection, get_schedule
 from src.plot import create_timeline_chart
 from src.ui_components import render_sidebar
 
@@ -29,10 +28,8 @@ if len(field_collection.get_fields()) == 0:
         st.warning("No fields available. Please update the FieldCollection data.")
         st.stop()
 
-data_raw, data_clean = load_and_clean_data(config, config['param_name'])
-model = get_trained_model(config, config['param_name'], data_clean)
-predictions = get_predictions(config, config['param_name'], model, data_raw, config['year'])
-predictions_config = field_collection.apply_field_config(predictions)
+data_raw, _ = load_and_clean_data(config, config['param_name'])
+predictions = get_predictions(config, config['param_name'], data_raw, config['year'])
 
 # --- Main Content ---
 
@@ -53,23 +50,23 @@ if isinstance(start_dates, dict):
             start_dates_converted[group] = date_str
     start_dates = start_dates_converted
 
-schedule_df = schedule_field_work(
-        field_table=predictions_config,
-        workforce=workforce,
-        start_date=start_dates,
-        field_order_column='Field',
-        group_name='Variety Group',
-        hours_column='predicted_hours'
-        )
+schedule_df = get_schedule(field_collection, workforce, predictions, start_dates)
+if schedule_df.empty:
+        st.info("No fields could be scheduled. Please review the workforce, the fields and the start dates.")
+        st.stop()
 
 st.markdown('---')
 st.subheader("📆 Labour Timeline")
-group_names = list(schedule_df['Variety Group'].unique())
+# Split the schedule by group once instead of filtering it again for every tab
+group_schedules = dict(tuple(schedule_df.groupby('Variety Group', sort=False)))
+group_names = list(group_schedules)
 tabs = st.tabs(group_names)
+# Read the clock once, so that all timelines mark the same current time
+now = datetime.now()
 for tab, group_name in zip(tabs, group_names):
     with tab:
-        group_data = schedule_df[schedule_df['Variety Group'] == group_name]
-        timeline_fig = create_timeline_chart(group_data, datetime.now())
+        group_data = group_schedules[group_name]
+        timeline_fig = create_timeline_chart(group_data, now)
         st.plotly_chart(timeline_fig, use_container_width=True)
 
         col1, col2 = st.columns(2)
@@ -1,7 +1,6 @@
 import streamlit as st
 import plotly.express as px
 import pandas as pd
-from datetime import datetime, timedelta
 
 from pathlib import Path
 
@@ -72,76 +71,87 @@ with st.form("add_worker_form"):
             st.error("Please fill in all fields.")
 
 # --- List and Modify Workers ---
+# Button callbacks run before the next script run, so the list is refreshed without an explicit st.rerun()
+def update_worker(name, worker_key):
+    updated_worker = Worker(
+        name=st.session_state[f'update_name_{worker_key}'],
+        start_date = st.session_state[f'update_start_date_{worker_key}'],
+        end_date = st.session_state[f'update_end_date_{worker_key}'],
+        work_hours=st.session_state[f'update_work_hours_{worker_key}'],
+        work_days=st.session_state[f'update_work_days_{worker_key}'],
+        payment=st.session_state[f'update_payment_{worker_key}'],
+    )
+    workforce.update_worker(name, updated_worker)
+    workforce.save(workforce_file)
+    st.toast(f"Updated worker {name}")
+
+def remove_worker(name):
+    workforce.remove_worker(name)
+    workforce.save(workforce_file)
+    st.toast(f"Removed worker {name}")
+
 st.header("Current Workforce")
 workers = workforce.get_workers()
 if not workers:
     st.info("No workers in the workforce.")
 else:
-    for i, worker in enumerate(workers):
-        # Use a combination of index and name for more stability
-        worker_key = f"{i}_{worker.name}"
-        with st.expander(f"Worker: {worker.name}"):
-            new_name = st.text_input("Name", value=worker.name, key=f'update_name_{worker_key}')
-            new_start_date = st.date_input("Start Date", value = worker.start_date, key=f'update_start_date_{worker_key}')
-            new_end_date = st.date_input("End Date", value = worker.end_date, key=f'update_end_date_{worker_key}')
-            new_work_days = st.multiselect(
-                "Working Days",
-                options=DAYS_OF_WEEK,
-                default=worker.work_days,  # Use the worker's current days
-                key=f'update_work_days_{worker_key}'
-            )
-            new_work_hours = st.number_input(
-                "Hours Per Day",
-                min_value=1.0,
-                max_value=24.0,
-                value=float(worker.work_hours),  # Use the worker's current hours
-                step=0.5,
-                key=f'update_work_hours_{worker_key}'
-            )
-            new_payment = st.number_input("Payment", min_value = 0.0, step = .5, value=float(worker.payment), key=f'update_payment_{worker_key}')
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button("Update", key=f"update_{worker_key}"):
-                    updated_worker = Worker(
-                        name=new_name,
-                        start_date = new_start_date,
-                        end_date = new_end_date,
-                        work_hours=new_work_hours,
-                        work_days=new_work_days,
-                        payment=new_payment,
-                    )
-                    workforce.update_worker(worker.name, updated_worker)
-                    workforce.save(workforce_file)
-                    st.success(f"Updated worker {worker.name}")
-                    st.rerun()  # Force rerun to refresh the worker list
-            with col2:
-                if st.button("Remove", key=f"remove_{worker_key}"):
-                    workforce.remove_worker(worker.name)
-                    workforce.save(workforce_file)
-                    st.warning(f"Removed worker {worker.name}")
-                    st.rerun()  # Force rerun to refresh the worker list
+    # All workers are listed in a single table and only the selected worker gets edit widgets,
+    # instead of one expander with its own columns per worker
+    st.dataframe(
+        pd.DataFrame(
+            {
+                "Name": [worker.name for worker in workers],
+                "Start Date": [worker.start_date.date() for worker in workers],
+                "End Date": [worker.end_date.date() for worker in workers],
+                "Working Days": [", ".join(worker.work_days) for worker in workers],
+                "Hours Per Day": [worker.work_hours for worker in workers],
+                "Payment": [worker.payment for worker in workers],
+            }
+        ),
+        hide_index=True
+    )
+
+    i = st.selectbox("Edit Worker", options=range(len(workers)), format_func=lambda idx: workers[idx].name)
+    worker = workers[i]
+    # Use a combination of index and name for more stability
+    worker_key = f"{i}_{worker.name}"
+    # Edits are only sent with the Update button, so typing doesn't rerun the page and redraw the chart
+    with st.form(f"edit_worker_form_{worker_key}"):
+        new_name = st.text_input("Name", value=worker.name, key=f'update_name_{worker_key}')
+        new_start_date = st.date_input("Start Date", value = worker.start_date, key=f'update_start_date_{worker_key}')
+        new_end_date = st.date_input("End Date", value = worker.end_date, key=f'update_end_date_{worker_key}')
+        new_work_days = st.multiselect(
+            "Working Days",
+            options=DAYS_OF_WEEK,
+            default=worker.work_days,  # Use the worker's current days
+            key=f'update_work_days_{worker_key}'
+        )
+        new_work_hours = st.number_input(
+            "Hours Per Day",
+            min_value=1.0,
+            max_value=24.0,
+            value=float(worker.work_hours),  # Use the worker's current hours
+            step=0.5,
+            key=f'update_work_hours_{worker_key}'
+        )
+        new_payment = st.number_input("Payment", min_value = 0.0, step = .5, value=float(worker.payment), key=f'update_payment_{worker_key}')
+        col1, col2 = st.columns(2)
+        with col1:
+            st.form_submit_button("Update", on_click=update_worker, args=(worker.name, worker_key))
+        with col2:
+            st.form_submit_button("Remove", on_click=remove_worker, args=(worker.name,))
 
 # --- Daily Work Hours Visualization ---
 st.header("Daily Work Hours Overview")
 workers = workforce.get_workers()
 
 if workers:
-    # Find the date range across all workers
-    start_dates = [worker.start_date.date() if hasattr(worker.start_date, 'date') else worker.start_date for worker in workers]
-    end_dates = [worker.end_date.date() if hasattr(worker.end_date, 'date') else worker.end_date for worker in workers]
-    
-    overall_start = min(start_dates)
-    overall_end = max(end_dates)
-    
-    # Generate all dates in the range
-    dates = []
-    daily_hours = []
-    current_date = overall_start
+    # Find the date range across all workers, without building intermediate lists of dates
+    overall_start = min(worker.start_date for worker in workers).date()
+    overall_end = max(worker.end_date for worker in workers).date()
     
-    while current_date <= overall_end:
-        dates.append(current_date)
-        daily_hours.append(workforce.get_daily_work_hours(current_date))
-        current_date += timedelta(days=1)
+    # Daily work hours for all dates in the range, computed for all days at once
+    dates, daily_hours, _ = workforce.to_arrays(overall_start, overall_end)
     
     # Create DataFrame for Plotly
     df = pd.DataFrame({
@@ -176,9 +186,9 @@ if workers:
     with col1:
         st.metric("Total Days", len(dates))
     with col2:
-        st.metric("Average Daily Hours", f"{sum(daily_hours) / len(daily_hours):.1f}")
+        st.metric("Average Daily Hours", f"{daily_hours.mean():.1f}")
     with col3:
-        st.metric("Peak Daily Hours", max(daily_hours))
+        st.metric("Peak Daily Hours", daily_hours.max())
         
 else:
     st.info("Add workers to see the daily work hours visualization.")
\ No newline at end of file
@@ -1,11 +1,12 @@
 import streamlit as st
+import numpy as np
+import pandas as pd
 
 from pathlib import Path
 
 from src.app_state import load_config, load_field_collection
 from src.ui_components import render_sidebar
 from src.fields.field import Field
-from src.fields.field_collection import FieldCollection
 
 
 # Set page title
@@ -74,51 +75,58 @@ with st.form("add_field_form"):
             st.error("Please fill in Field Name and Variety.")
 
 # --- List and Modify Fields ---
-st.header("Current Fields")
-fields = field_collection.get_fields()
-if not fields:
-    st.info("No fields in the collection.")
-else:
-    # Show fields in a table format for better overview
-    st.subheader("Field Overview")
-    st.table(field_collection.to_dataframe())
-
-    st.subheader("Edit Fields")
-    for i, field in enumerate(fields):
-        with st.expander(f"#{field.order}: {field.field} ({field.variety}) - Round {field.harvest_round}"):
-            updated_name = st.text_input("Field Name", value=field.field, key=f"name_{i}")
-            updated_variety = st.text_input("Variety", value=field.variety, key=f"variety_{i}")
-            updated_harvest_round = st.number_input("Harvest Round", value=field.harvest_round, min_value=1, step=1, key=f"harvest_round_{i}", help="Harvest round number")
-
-            # Show current position and allow reordering
-            current_order = field.order if field.order is not None else i + 1
-            updated_order = st.number_input(
-                "Order (Position)",
-                value=current_order,
-                min_value=1,
-                max_value=len(fields),
-                step=1,
-                key=f"order_{i}",
-                help="Change position to reorder this field. Other fields will be shifted accordingly."
-            )
-
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button("Update", key=f"update_{i}"):
-                    try:
-                        updated_field = Field(field=updated_name, variety=updated_variety, harvest_round=updated_harvest_round, order=updated_order)
-                        field_collection.update_field(field.field, field.variety, field.harvest_round, updated_field)
-                        field_collection.save(fields_file)
-                        st.success(f"Field '{updated_name}' updated.")
-                        st.rerun()  # Force rerun to refresh the field list
-                    except Exception as e:
-                        st.error(str(e))
-            with col2:
-                if st.button("Remove", key=f"remove_{i}"):
-                    try:
-                        field_collection.remove_field(field.field, field.variety, field.harvest_round)
-                        field_collection.save(fields_file)
-                        st.warning(f"Field '{field.field}' ({field.variety}) - Round {field.harvest_round} removed.")
-                        st.rerun()  # Force rerun to refresh the field list
-                    except Exception as e:
-                        st.error(str(e))
\ No newline at end of file
+# Rendered as a fragment, so that edits in the table only rerun this section and not the whole page
+@st.fragment
+def render_fields_editor():
+    st.header("Current Fields")
+    fields = field_collection.get_fields()
+    if not fields:
+        st.info("No fields in the collection.")
+    else:
+        # All fields are edited in a single table instead of one set of widgets per field
+        st.subheader("Edit Fields")
+        st.caption("Edit the table and change the Order column to reorder fields. Select rows and delete them to remove fields.")
+        original_fields = field_collection.to_dataframe()
+        edited_fields = st.data_editor(
+            original_fields,
+            num_rows="dynamic",
+            hide_index=True,
+            key="fields_editor",
+            column_config={
+                "Order": st.column_config.NumberColumn("Order", min_value=1, step=1, help="Position of the field. Other fields are shifted accordingly."),
+                "Field": st.column_config.TextColumn("Field", required=True),
+                "Variety": st.column_config.TextColumn("Variety", required=True),
+                "Harvest Round": st.column_config.NumberColumn("Harvest Round", min_value=1, step=1, default=1, help="Harvest round number")
+            }
+        )
+
+        if st.button("Save Changes"):
+            try:
+                # Rebuild the collection in the edited order, rows without an order are appended at the end.
+                # A moved or added row takes the position it was given and the other fields are shifted: on equal
+                # orders, rows moved up or added come before the unchanged rows and rows moved down after them
+                updated_fields = []
+                move_direction = np.sign(
+                    pd.to_numeric(edited_fields["Order"]) - original_fields["Order"].reindex(edited_fields.index)
+                ).fillna(-1)
+                edited_rows = (
+                    edited_fields.assign(_move_direction=move_direction)
+                    .sort_values(["Order", "_move_direction"], kind="stable", na_position="last")
+                )
+
+                # Missing values are checked for the whole table at once instead of calling pd.isna per cell
+                names = edited_rows[["Field", "Variety"]]
+                if names.isna().any(axis=None) or (names == "").any(axis=None):
+                    raise ValueError("Please fill in Field Name and Variety for all fields.")
+                harvest_rounds = edited_rows["Harvest Round"].fillna(1).astype(int)
+
+                for field_name, variety, harvest_round in zip(edited_rows["Field"], edited_rows["Variety"], harvest_rounds):
+                    updated_fields.append(Field(field=field_name, variety=variety, harvest_round=harvest_round))
+                field_collection.set_fields(updated_fields)
+                field_collection.save(fields_file)
+                st.success("Fields updated.")
+                st.rerun()  # Rerun the whole page, not only the fragment, to refresh the field list
+            except Exception as e:
+                st.error(str(e))
+
+render_fields_editor()
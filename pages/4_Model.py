@@ -35,7 +35,7 @@ render_sidebar(config)
 param_name = config['param_name']
 data_raw, data_clean = load_and_clean_data(config, param_name)
 model = get_trained_model(config, param_name, data_clean)
-predictions = get_predictions(config, param_name, model, data_raw)
+predictions = get_predictions(config, param_name, data_raw)
 
 # Header
 st.title("🎯 Model Performance Dashboard")
@@ -5,6 +5,9 @@ import datetime
 from src.app_state import save_config, load_config, CONFIG_PATH
 from src.ui_components import render_sidebar
 
+DEFAULT_YEAR = 2025
+DEFAULT_PARAM_NAME = "Ernte"
+
 # Set page title
 st.set_page_config(page_title="Settings", page_icon="⚙️")
 st.title("Settings")
@@ -36,14 +39,14 @@ with tabs[0]:
         "Year",
         min_value=2020,
         max_value=2030,
-        value=int(config.get("year", 2025)),
+        value=int(config.get("year", DEFAULT_YEAR)),
         help="The year for scheduling"
     )
 
     # Parameter name setting
     config["param_name"] = st.text_input(
         "Parameter Name",
-        value=config.get("param_name", "Ernte"),
+        value=config.get("param_name", DEFAULT_PARAM_NAME),
         help="Parameter name to use in the application"
     )
 
@@ -3,19 +3,23 @@ import yaml
 import importlib
 
 from pathlib import Path
-import datetime
 
-from .data import GoogleSheetsHandler
-from .worker import Workforce
+from .worker import Workforce, WorkforceLoadError
+from .planner.scheduler import schedule_field_work
 from src.fields.field_collection import FieldCollection
 
+# Use the libyaml bindings when available
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 CONFIG_PATH = "config/config.yaml"
 
 @st.cache_data
 def load_config(file):
     try:
-        with open(file, 'r', encoding = 'utf-8') as f:
-            config = yaml.safe_load(f)
+        config = yaml.load(Path(file).read_bytes(), Loader=SafeLoader)
         return config
     except Exception as e:
         st.error(f"Error reading config file: {str(e)}")
@@ -25,7 +29,7 @@ def save_config(config, file) -> bool:
     """Save configuration to YAML file"""
     try:
         with open(file, 'w', encoding = 'utf-8') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
         return True
     except Exception as e:
         st.error(f"Error saving configuration: {str(e)}")
@@ -36,11 +40,26 @@ def load_workforce(config):
     workforce_file = Path("config", f"Workforce_{config['year']}.yaml")
 
     if workforce_file.exists():
-        workforce = Workforce()
-        workforce.load(filename = workforce_file)
+        # The modification time is part of the cache key, so saving the workforce invalidates the cached copy
+        workforce = load_workforce_file(str(workforce_file), workforce_file.stat().st_mtime)
+        if isinstance(workforce, WorkforceLoadError):
+            st.error(str(workforce))
+            st.stop()
         return workforce
     return Workforce()
 
+@st.cache_data(show_spinner=False)
+def load_workforce_file(filename, mtime):
+    # cache_data returns a copy on every call, so the pages can modify the workforce without changing the cached one
+    workforce = Workforce()
+    try:
+        workforce.load(filename = filename)
+    except WorkforceLoadError as e:
+        # Returned instead of raised so that the failure is cached as well, and a broken file
+        # isn't parsed again on every rerun until it is changed
+        return e
+    return workforce
+
 def load_field_collection(config):
     
     field_collection_file = Path("config", f"field_collection_{config['year']}.yaml")
@@ -51,10 +70,10 @@ def load_field_collection(config):
         return collection
     return FieldCollection()
 
-def load_model_class(config, param_name):
+def load_model_class(model_config):
     try:
         # Get the full class path
-        class_path = config['models'][param_name]['class']
+        class_path = model_config['class']
 
         # Split module path and class name
         module_path, class_name = class_path.rsplit('.', 1)
@@ -69,17 +88,28 @@ def load_model_class(config, param_name):
     except KeyError as e:
         raise KeyError(f"Missing config key: {e}")
 
-@st.cache_data
-def load_data(config):
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_gsheet(credentials_file, spreadsheet_url, worksheet_name):
+    """Download the worksheet. Cached on the sheet settings only, so that other config changes don't trigger a new download"""
+    # Imported here, as the Google Sheets and validation libraries are slow to import and only needed for the download
+    from .data import GoogleSheetsHandler
+
     gsheets = GoogleSheetsHandler()
-    gsheets.setup_credentials_from_file(config['gsheets']['credentials_file'])
+    gsheets.setup_credentials_from_file(credentials_file)
     field_data = gsheets.run(
-        spreadsheet_url=config['gsheets']['spreadsheet_url'], 
-        worksheet_name=config['gsheets']['worksheet_name']
+        spreadsheet_url=spreadsheet_url, 
+        worksheet_name=worksheet_name
     )
 
     return field_data
 
+def load_data(config):
+    return fetch_gsheet(
+        config['gsheets']['credentials_file'],
+        config['gsheets']['spreadsheet_url'],
+        config['gsheets']['worksheet_name']
+    )
+
 def clean_data(data, config, param_name, include_target = True):
     if include_target:
         return data.dropna(subset=[config['models'][param_name]['target']] + config['models'][param_name]['predictors'])
@@ -92,24 +122,35 @@ def load_and_clean_data(config, param_name, include_target = True):
     data_clean = clean_data(data_raw, config, param_name, include_target)
     return data_raw, data_clean
 
-@st.cache_resource
 def get_trained_model(config, param_name, data):
-    model = load_model_class(config, param_name)
-    predictor = model()
+    # Only the settings of the selected model are passed on, so that changes to other
+    # settings (e.g. the year) don't retrain the model
+    return train_model(config['models'][param_name], data)
+
+@st.cache_resource(show_spinner="Training model...")
+def train_model(model_config, data):
+    model = load_model_class(model_config)
+    # Optional keyword arguments for the predictor, e.g. max_depth for the random forest
+    predictor = model(**model_config.get('model_params', {}))
     _ = predictor.train(
         data=data,
-        target_column=config['models'][param_name]['target'],
-        feature_columns=config['models'][param_name]['predictors'],
-        cv_method=config['models'][param_name]['cv_method'],
-        cv_params=config['models'][param_name]['cv_params']
+        target_column=model_config['target'],
+        feature_columns=model_config['predictors'],
+        cv_method=model_config['cv_method'],
+        cv_params=model_config['cv_params']
     )
 
     return predictor
 
-def get_predictions(config, param_name, model, data, year: int = None):
+@st.cache_data(show_spinner=False)
+def get_predictions(config, param_name, data, year: int = None):
+    # The model is looked up here instead of being passed in, so the cache key (config, data and year)
+    # also determines the model. train_model caches the fitted model, so this does not retrain it
+    model = get_trained_model(config, param_name, clean_data(data, config, param_name))
 
+    # Boolean indexing already returns a new frame; only the unfiltered data needs an explicit copy
     if year is not None:
-        data_to_predict = data.copy().loc[data['Year'] == year]
+        data_to_predict = data.loc[data['Year'] == year]
     else:
         data_to_predict = data.copy()
     data_to_predict = clean_data(data_to_predict, config, param_name, include_target=False)
@@ -126,4 +167,15 @@ def get_predictions(config, param_name, model, data, year: int = None):
 
     return data_to_predict
 
-
+@st.cache_data(show_spinner=False, hash_funcs={Workforce: Workforce.key, FieldCollection: FieldCollection.key})
+def get_schedule(field_collection, workforce, predictions, start_dates):
+    """Expand the predictions with the field collection and schedule them. Reruns with unchanged inputs are served from the cache"""
+    predictions_config = field_collection.apply_field_config(predictions)
+    return schedule_field_work(
+        field_table=predictions_config,
+        workforce=workforce,
+        start_date=start_dates,
+        field_order_column='Field',
+        group_name='Variety Group',
+        hours_column='predicted_hours'
+    )
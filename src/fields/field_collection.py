@@ -3,10 +3,28 @@ import streamlit as st
 import pandas as pd
 
 from pathlib import Path
+from pydantic import TypeAdapter
+
+from .field import Field
+
+# Use the libyaml bindings when available
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Validator and serializer for a list of fields, shared by save and load
+_fields_adapter = TypeAdapter(list[Field])
 
 class FieldCollection:
     def __init__(self):
         self.fields = []
+        # (field, variety, harvest round) of all fields, kept alongside the list for constant time uniqueness checks
+        self._keys = set()
+
+    @staticmethod
+    def _key(field):
+        return (field.field, field.variety, field.harvest_round)
 
     def _update_field_order(self):
         """Update field order to be sequential starting from 1"""
@@ -16,9 +34,9 @@ class FieldCollection:
     def add_field(self, field):
         """Add a field at the specified order position, shifting other fields as needed"""
         # Uniqueness is now based on field name, variety, and harvest round
-        for f in self.fields:
-            if f.field == field.field and f.variety == field.variety and f.harvest_round == field.harvest_round:
-                raise ValueError(f"Field with name '{field.field}', variety '{field.variety}', and harvest round {field.harvest_round} already exists.")
+        if self._key(field) in self._keys:
+            raise ValueError(f"Field with name '{field.field}', variety '{field.variety}', and harvest round {field.harvest_round} already exists.")
+        self._keys.add(self._key(field))
 
         # Handle None order - append to end
         if field.order is None:
@@ -38,25 +56,41 @@ class FieldCollection:
     def get_fields(self):
         return self.fields
 
+    def set_fields(self, fields):
+        """Replace all fields, keeping the given sequence as the field order"""
+        seen = set()
+        for field in fields:
+            key = self._key(field)
+            if key in seen:
+                raise ValueError(f"Field with name '{field.field}', variety '{field.variety}', and harvest round {field.harvest_round} already exists.")
+            seen.add(key)
+
+        self.fields = list(fields)
+        self._keys = seen
+        self._update_field_order()
+
+    def key(self):
+        """Hashable snapshot of the fields, used to cache results computed from this collection"""
+        return tuple(field.model_dump_json() for field in self.fields)
+
     def update_field(self, field_name, variety, harvest_round, new_field):
         """Update an existing field, handling order changes properly"""
-        # Find the field to update
-        old_field_index = None
-        for idx, f in enumerate(self.fields):
-            if f.field == field_name and f.variety == variety and f.harvest_round == harvest_round:
-                old_field_index = idx
-                break
-        
-        if old_field_index is None:
+        old_key = (field_name, variety, harvest_round)
+        new_key = self._key(new_field)
+        if old_key not in self._keys:
             raise ValueError(f"Field with name '{field_name}', variety '{variety}', and harvest round {harvest_round} not found.")
         
         # Check for uniqueness (excluding the field being updated)
-        for idx, f in enumerate(self.fields):
-            if idx != old_field_index and f.field == new_field.field and f.variety == new_field.variety and f.harvest_round == new_field.harvest_round:
-                raise ValueError(f"Field with name '{new_field.field}', variety '{new_field.variety}', and harvest round {new_field.harvest_round} already exists.")
+        if new_key != old_key and new_key in self._keys:
+            raise ValueError(f"Field with name '{new_field.field}', variety '{new_field.variety}', and harvest round {new_field.harvest_round} already exists.")
+
+        # Find the field to update
+        old_field_index = next(idx for idx, f in enumerate(self.fields) if self._key(f) == old_key)
         
         # Remove the old field
         self.fields.pop(old_field_index)
+        self._keys.discard(old_key)
+        self._keys.add(new_key)
 
         # Handle None order - keep at end
         if new_field.order is None:
@@ -77,48 +111,56 @@ class FieldCollection:
         for idx, f in enumerate(self.fields):
             if f.field == field_name and f.variety == variety and f.harvest_round == harvest_round:
                 del self.fields[idx]
+                self._keys.discard((field_name, variety, harvest_round))
                 self._update_field_order()
                 return
         raise ValueError(f"Field with name '{field_name}', variety '{variety}', and harvest round {harvest_round} not found.")
 
     def save(self, filename='FieldsCollection.yaml'):
-        # Convert Pydantic models to dictionaries, excluding the workforce field
-        fields_data = [field.model_dump() for field in self.fields]
+        """Save fields to YAML, or to Parquet if the filename ends with .parquet (recommended for large collections)"""
+        # Convert Pydantic models to dictionaries in a single pass over the list
+        fields_data = _fields_adapter.dump_python(self.fields)
 
         Path(filename).parent.mkdir(parents=True, exist_ok=True)
 
+        if Path(filename).suffix == '.parquet':
+            pd.DataFrame(fields_data).to_parquet(filename, compression='zstd', index=False)
+            return
+
         # Save to YAML file
         with open(filename, 'w') as file:
-            yaml.dump(fields_data, file, default_flow_style=False, indent=2)
+            yaml.dump(fields_data, file, Dumper=SafeDumper, default_flow_style=False, indent=2)
     
     def load(self, filename='FieldsCollection.yaml'):
+        """Load fields from a YAML or Parquet file, selected by the file extension"""
         try:
-            with open(filename, 'r') as f:
-                data = yaml.safe_load(f)
+            if Path(filename).suffix == '.parquet':
+                data = pd.read_parquet(filename).to_dict('records')
+            else:
+                # The whole file is passed to the loader as bytes, so it doesn't read through a text file wrapper
+                data = yaml.load(Path(filename).read_bytes(), Loader=SafeLoader)
                 if data is None:
                     return
-            # Import Field here to avoid circular import
-            from .field import Field
-            self.fields = [Field(**item) for item in data]
+            self.fields = _fields_adapter.validate_python(data)
+            self._keys = {self._key(field) for field in self.fields}
             # Ensure proper ordering after loading
             self._update_field_order()
         except FileNotFoundError:
             st.warning(f"File {filename} not found. Starting with empty fields.")
             self.fields = []
+            self._keys = set()
         except Exception as e:
             st.error(f"Error loading fields from {filename}: {e}")
             st.stop()
 
     def to_dataframe(self):
-        field_data = []
-        for field in self.fields:
-            field_data.append({
-                "Order": field.order,
-                "Field": field.field,
-                "Variety": field.variety,
-                "Harvest Round": field.harvest_round
-            })
-        return pd.DataFrame(field_data)
+        # Build the columns directly instead of a list of one dict per field
+        return pd.DataFrame({
+            "Order": [field.order for field in self.fields],
+            "Field": [field.field for field in self.fields],
+            "Variety": [field.variety for field in self.fields],
+            "Harvest Round": [field.harvest_round for field in self.fields]
+        })
 
     def apply_field_config(self, fields_table):
         """
@@ -136,68 +178,35 @@ class FieldCollection:
             result_df['Harvest Round'] = 1
             return result_df.iloc[0:0]
 
-        # Get collection data as DataFrame
-        collection_df = self.to_dataframe()
+        key_columns = ['_field_key', '_variety_key']
+        table_columns = [col for col in fields_table.columns if col not in ('Order', 'Harvest Round')]
 
-        # Create expanded rows based on the field collection order
-        expanded_rows = []
-
-        # Normalize case for matching
-        fields_table_normalized = fields_table.copy()
-        fields_table_normalized['Field'] = fields_table_normalized['Field'].str.lower()
-        fields_table_normalized['Variety'] = fields_table_normalized['Variety'].str.lower()
-
-        # Calculate total harvest rounds per field-variety combination
-        harvest_counts = {}
-        for field in self.fields:
-            key = (field.field.lower(), field.variety.lower())
-            if key not in harvest_counts:
-                harvest_counts[key] = 0
-            harvest_counts[key] = max(harvest_counts[key], field.harvest_round)
-
-        # Process each field in the collection (preserving order)
-        for field in self.fields:
-            field_name_lower = field.field.lower()
-            variety_lower = field.variety.lower()
-
-            # Find matching row in fields_table
-            matching_rows = fields_table_normalized[
-                (fields_table_normalized['Field'] == field_name_lower) &
-                (fields_table_normalized['Variety'] == variety_lower)
-            ]
-
-            if matching_rows.empty:
-                st.warning(f"Field '{field.field}' with variety '{field.variety}' not found in the table.")
-                continue  # Skip if field not found in table
-
-            # Get the first matching row (should be unique per field-variety)
-            field_row = matching_rows.iloc[0].copy()
-
-            # Get total harvest rounds for this field-variety combination
-            total_harvest_rounds = harvest_counts[(field_name_lower, variety_lower)]
-
-            # Create row for this specific harvest round
-            row_dict = field_row.to_dict()
-            row_dict['Order'] = field.order
-            row_dict['Field'] = field.field  # Restore original case
-            row_dict['Variety'] = field.variety  # Restore original case
-            row_dict['Harvest Round'] = field.harvest_round
-
-            # Divide predicted hours by total harvest rounds for this field
-            if 'predicted_hours' in row_dict and row_dict['predicted_hours'] is not None:
-                row_dict['predicted_hours'] = row_dict['predicted_hours'] / total_harvest_rounds
-
-            expanded_rows.append(row_dict)
-
-        # Create new dataframe with expanded rows
-        if expanded_rows:
-            result_df = pd.DataFrame(expanded_rows)
-            # Sort by order to maintain the sequence from FieldCollection
-            result_df = result_df.sort_values('Order').reset_index(drop=True)
-            return result_df
-        else:
-            # Return empty DataFrame with same structure plus required columns
-            result_df = fields_table.copy()
-            result_df['Harvest Round'] = 1
-            result_df['Order'] = None
-            return result_df.iloc[0:0]
\ No newline at end of file
+        # Get collection data as DataFrame and normalize case for matching
+        collection_df = self.to_dataframe()
+        collection_df['_field_key'] = collection_df['Field'].str.lower()
+        collection_df['_variety_key'] = collection_df['Variety'].str.lower()
+
+        # Keep the first row per field-variety combination (should be unique)
+        table_normalized = fields_table[table_columns].drop(columns=['Field', 'Variety'])
+        table_normalized['_field_key'] = fields_table['Field'].str.lower()
+        table_normalized['_variety_key'] = fields_table['Variety'].str.lower()
+        table_normalized = table_normalized.drop_duplicates(subset=key_columns)
+
+        # Skip fields that are not in the table. Only matching fields are merged, so that integer columns
+        # are not converted to float by missing values
+        found = pd.MultiIndex.from_frame(collection_df[key_columns]).isin(
+            pd.MultiIndex.from_frame(table_normalized[key_columns])
+        )
+        for field_name, variety in zip(collection_df.loc[~found, 'Field'], collection_df.loc[~found, 'Variety']):
+            st.warning(f"Field '{field_name}' with variety '{variety}' not found in the table.")
+
+        result_df = collection_df.loc[found].merge(table_normalized, on=key_columns, how='left')
+
+        # Divide predicted hours by the total harvest rounds of each field-variety combination
+        if 'predicted_hours' in result_df.columns:
+            total_harvest_rounds = result_df.groupby(key_columns)['Harvest Round'].transform('max')
+            result_df['predicted_hours'] = result_df['predicted_hours'].to_numpy() / total_harvest_rounds.to_numpy()
+
+        # Sort by order to maintain the sequence from FieldCollection
+        result_df = result_df[table_columns + ['Order', 'Harvest Round']]
+        return result_df.sort_values('Order').reset_index(drop=True)
@@ -1,29 +1,104 @@
 import numpy as np
-import pandas as pd
 from sklearn.model_selection import (
     train_test_split, LeaveOneOut, 
     GroupKFold, TimeSeriesSplit, KFold
 )
-from sklearn.preprocessing import StandardScaler, OneHotEncoder, LabelEncoder
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder
+from sklearn.compose import ColumnTransformer
 from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
+from sklearn.exceptions import ConvergenceWarning
+from joblib import Parallel, delayed, effective_n_jobs, parallel_config, hash as joblib_hash
+from contextlib import nullcontext
+from collections import OrderedDict
 
 import warnings
 from abc import ABC, abstractmethod
-warnings.filterwarnings('ignore')
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional, the NumPy metrics are used without it
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit('UniTuple(float64, 3)(float64[::1], float64[::1])', cache=True, fastmath=True)
+    def _fused_metrics_numba(y_true, y_pred):
+        """
+        Compiled version of BasePredictor._fused_metrics for the many small folds of leave-one-out.
+
+        R² is only computed for more than one sample and is NaN otherwise.
+
+        Returns:
+            tuple: (r2, mse, mae)
+        """
+        n = y_true.shape[0]
+        ss_res = 0.0
+        abs_sum = 0.0
+        for i in range(n):
+            residual = y_true[i] - y_pred[i]
+            ss_res += residual * residual
+            abs_sum += abs(residual)
+        mse = ss_res / n
+        mae = abs_sum / n
+
+        if n < 2:
+            return np.nan, mse, mae
+
+        y_mean = y_true.sum() / n
+        ss_tot = 0.0
+        for i in range(n):
+            deviation = y_true[i] - y_mean
+            ss_tot += deviation * deviation
+        if ss_tot == 0:
+            r2 = 1.0 if ss_res == 0 else 0.0
+        else:
+            r2 = 1 - ss_res / ss_tot
+        return r2, mse, mae
+
+def _run_fold(train_idx, test_idx, X_values, y_values, model_factory):
+    """
+    Fit a fresh model on a single cross-validation fold and predict its test samples.
+
+    Defined at module level so that joblib can pickle it for the worker processes.
+
+    Returns:
+        tuple: (y_pred, test_idx, model) where model is the fitted model for the
+            final all-data fold (empty test_idx) and None for regular folds
+    """
+    model = model_factory()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', ConvergenceWarning)
+        model.fit(X_values[train_idx], y_values[train_idx])
+
+    if len(test_idx) == 0:
+        return None, test_idx, model
+
+    return model.predict(X_values[test_idx]), test_idx, None
 
 class BasePredictor(ABC):
-    def __init__(self, categorical_encoding='onehot'):
+    # Materialized cross-validation splits shared by all predictors, see _get_cv_splits. Only the most
+    # recently used splits are kept, leave-one-out splits grow quadratically with the number of samples
+    _split_cache = OrderedDict()
+    _split_cache_size = 8
+
+    # joblib backend preference for fitting the cross-validation folds. Models that release the GIL
+    # while fitting can use 'threads' to avoid pickling the data for every worker
+    cv_prefer = 'processes'
+
+    def __init__(self, categorical_encoding='onehot', input_dtype=np.float64):
         """
         Initialize the predictor with specified model type and encoding method.
         
         Args:
             model_type (str): Either 'linear' or 'random_forest'
             categorical_encoding (str): Either 'onehot' or 'label'
+            input_dtype: Floating point dtype of the encoded feature matrix. np.float32 halves the memory
+                traffic of fitting at the cost of single precision results
         """
         self.categorical_encoding = categorical_encoding
+        self.input_dtype = input_dtype
         self.model = None
-        self.scaler = None
-        self.categorical_encoders = {}  # Store encoders for each categorical column
+        self.preprocessor = None  # ColumnTransformer encoding the categorical columns
         self.feature_columns = None
         self.categorical_columns = None
         self.numerical_columns = None
@@ -32,6 +107,7 @@ class BasePredictor(ABC):
         self.metrics = {}
         self.cv_results = {}
         self.encoded_feature_names = None  # Store final feature names after encoding
+        self._feature_means = None  # Training means of the numerical features, used to impute missing values
 
     @abstractmethod
     def _init_model(self):
@@ -58,7 +134,9 @@ class BasePredictor(ABC):
                 - 'leave_one_out': Leave-one-out cross-validation
                 - 'group_kfold': Grouped K-fold (e.g., by year)
                 - 'time_series': Time series split
-            cv_params (dict): Parameters for cross-validation method
+            cv_params (dict): Parameters for cross-validation method. 'n_jobs' sets the number of
+                parallel workers used to fit the folds (default -1, all cores). With more than one
+                worker, each fold model and its BLAS calls use a single thread to avoid oversubscription
             random_state (int): Random state for reproducibility
             
         Returns:
@@ -80,6 +158,9 @@ class BasePredictor(ABC):
         # Prepare data
         # data_clean = data.dropna(subset=[target_column] + feature_columns)
         X_encoded, y = self._prepare_data(data, fit_encoders=True)
+
+        # The numerical columns come first in the encoded matrix
+        self._feature_means = X_encoded[:, :len(self.numerical_columns)].mean(axis=0)
                         
         # Set default cv_params if not provided
         if cv_params is None:
@@ -91,7 +172,7 @@ class BasePredictor(ABC):
         elif cv_method == 'kfold':
             self._kfold_validation(X_encoded, y, cv_params, random_state)
         elif cv_method == 'leave_one_out':
-            self._leave_one_out_validation(X_encoded, y)
+            self._leave_one_out_validation(X_encoded, y, cv_params)
         elif cv_method == 'group_kfold':
             self._group_kfold_validation(X_encoded, y, data, cv_params, random_state)
         elif cv_method == 'time_series':
@@ -99,13 +180,9 @@ class BasePredictor(ABC):
         else:
             raise ValueError(f"Unknown cv_method: {cv_method}")
         
-        # Train final model on all data
-        if self.scaler is not None:
-            X_scaled = self.scaler.fit_transform(X_encoded)
-        else:
-            X_scaled = X_encoded
-        
-        self.model.fit(X_scaled, y)
+        # Train final model on all data (the cross-validation methods fit it as an additional fold)
+        if cv_method == 'simple_split':
+            self.model.fit(X_encoded, y)
         
         # Add feature importance for random forest
         if hasattr(self.model, 'feature_importances_'):
@@ -115,6 +192,24 @@ class BasePredictor(ABC):
         self.is_trained = True
         return self.metrics
 
+    def _init_preprocessor(self):
+        """Create the ColumnTransformer that passes numerical columns through and encodes categorical columns."""
+        if self.categorical_encoding == 'onehot':
+            encoder = OneHotEncoder(sparse_output=False, handle_unknown='ignore')
+        elif self.categorical_encoding == 'label':
+            encoder = OrdinalEncoder(handle_unknown='use_encoded_value', unknown_value=-1)
+        else:
+            raise ValueError(f"Unknown categorical_encoding: {self.categorical_encoding}")
+        
+        return ColumnTransformer(
+            [
+                ('num', 'passthrough', self.numerical_columns),
+                ('cat', encoder, self.categorical_columns)
+            ],
+            sparse_threshold=0,
+            verbose_feature_names_out=False
+        )
+
     def _prepare_data(self, data, fit_encoders=False):
         """
         Prepare data by encoding categorical variables and handling missing values.
@@ -124,76 +219,34 @@ class BasePredictor(ABC):
             fit_encoders (bool): Whether to fit the encoders (True for training, False for prediction)
             
         Returns:
-            tuple: (X_encoded, y) where X_encoded is the processed feature matrix
+            tuple: (X_encoded, y) where X_encoded is the processed feature matrix and y the target, both as NumPy arrays
         """
         # Extract target
         if self.target_column not in data.columns:
             raise ValueError(f"Target column '{self.target_column}' not found in data")
-        y = data[self.target_column].copy()
+        y = data[self.target_column].to_numpy()
         
-        # Handle numerical columns
-        if not all(col in data.columns for col in self.numerical_columns):
-            raise ValueError(f"Not all numerical columns {self.numerical_columns} found in data")
-        X_numerical = data[self.numerical_columns].copy()
+        # Check feature columns
+        missing_columns = [col for col in self.feature_columns if col not in data.columns]
+        if missing_columns:
+            raise ValueError(f"Feature columns {missing_columns} not found in data")
         
-        # Handle categorical columns
-        X_categorical_encoded = pd.DataFrame()
+        # Fill missing categorical values with 'Unknown'
+        X = data[self.feature_columns].fillna({col: 'Unknown' for col in self.categorical_columns})
         
-        for col in self.categorical_columns:
-            if col not in data.columns:
-                raise ValueError(f"Categorical column '{col}' not found in data")
-            
-            # Fill missing values with mode or 'Unknown'
-            col_data = data[col].fillna('Unknown')
-            
-            if fit_encoders:
-                # Fit and transform during training
-                if self.categorical_encoding == 'onehot':
-                    encoder = OneHotEncoder(sparse_output=False, handle_unknown='ignore')
-                    encoded_data = encoder.fit_transform(col_data.values.reshape(-1, 1))
-                    
-                    # Create column names
-                    feature_names = [f"{col}_{category}" for category in encoder.categories_[0]]
-                    encoded_df = pd.DataFrame(encoded_data, columns=feature_names, index=data.index)
-                    
-                elif self.categorical_encoding == 'label':
-                    encoder = LabelEncoder()
-                    encoded_data = encoder.fit_transform(col_data)
-                    encoded_df = pd.DataFrame({col: encoded_data}, index=data.index)
-                    feature_names = [col]
-                
-                self.categorical_encoders[col] = encoder
-                
-            else:
-                # Transform using fitted encoders during prediction
-                encoder = self.categorical_encoders[col]
-                
-                if self.categorical_encoding == 'onehot':
-                    encoded_data = encoder.transform(col_data.values.reshape(-1, 1))
-                    feature_names = [f"{col}_{category}" for category in encoder.categories_[0]]
-                    encoded_df = pd.DataFrame(encoded_data, columns=feature_names, index=data.index)
-                    
-                elif self.categorical_encoding == 'label':
-                    # Handle unknown categories in label encoding
-                    encoded_data = []
-                    for value in col_data:
-                        try:
-                            encoded_data.append(encoder.transform([value])[0])
-                        except ValueError:
-                            # Unknown category, assign -1 or most frequent class
-                            encoded_data.append(-1)
-                    
-                    encoded_df = pd.DataFrame({col: encoded_data}, index=data.index)
-                    feature_names = [col]
+        if fit_encoders:
+            # Fit and transform during training
+            self.preprocessor = self._init_preprocessor()
+            X_encoded = self.preprocessor.fit_transform(X)
             
-            X_categorical_encoded = pd.concat([X_categorical_encoded, encoded_df], axis=1)
-        
-        # Combine numerical and categorical features
-        X_encoded = pd.concat([X_numerical, X_categorical_encoded], axis=1)
+            # Store feature names for later use
+            self.encoded_feature_names = list(self.preprocessor.get_feature_names_out())
+        else:
+            # Transform using the fitted encoders during prediction. Unknown categories are encoded as all
+            # zeros (onehot) or -1 (label), so the output always has the training columns
+            X_encoded = self.preprocessor.transform(X)
         
-        # Store feature names for later use
-        if fit_encoders:
-            self.encoded_feature_names = list(X_encoded.columns)
+        X_encoded = np.asarray(X_encoded, dtype=self.input_dtype)
                 
         return X_encoded, y
     
@@ -205,19 +258,11 @@ class BasePredictor(ABC):
             X, y, test_size=test_size, random_state=random_state
         )
         
-        # Scale and train
-        if self.scaler is not None:
-            X_train_scaled = self.scaler.fit_transform(X_train)
-            X_test_scaled = self.scaler.transform(X_test)
-        else:
-            X_train_scaled = X_train
-            X_test_scaled = X_test
-        
         temp_model = self._get_model_copy()
-        temp_model.fit(X_train_scaled, y_train)
+        temp_model.fit(X_train, y_train)
         
-        y_pred_train = temp_model.predict(X_train_scaled)
-        y_pred_test = temp_model.predict(X_test_scaled)
+        y_pred_train = temp_model.predict(X_train)
+        y_pred_test = temp_model.predict(X_test)
         
         self.metrics = {
             'cv_method': 'simple_split',
@@ -234,12 +279,12 @@ class BasePredictor(ABC):
         n_splits = cv_params.get('n_splits', 5)
         cv = KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
         
-        self._perform_cross_validation(X, y, cv, 'kfold')
+        self._perform_cross_validation(X, y, cv, 'kfold', n_jobs=cv_params.get('n_jobs', -1))
     
-    def _leave_one_out_validation(self, X, y):
+    def _leave_one_out_validation(self, X, y, cv_params):
         """Leave-one-out cross-validation."""
         cv = LeaveOneOut()
-        self._perform_cross_validation(X, y, cv, 'leave_one_out')
+        self._perform_cross_validation(X, y, cv, 'leave_one_out', n_jobs=cv_params.get('n_jobs', -1))
     
     def _group_kfold_validation(self, X, y, data, cv_params, random_state):
         """Grouped K-fold cross-validation (e.g., by year)."""
@@ -255,7 +300,7 @@ class BasePredictor(ABC):
         groups = data[group_column]
         cv = GroupKFold(n_splits=n_splits)
         
-        self._perform_cross_validation(X, y, cv, 'group_kfold', groups=groups)
+        self._perform_cross_validation(X, y, cv, 'group_kfold', groups=groups, n_jobs=cv_params.get('n_jobs', -1))
         
         # Add group information to metrics
         unique_groups = sorted(groups.unique())
@@ -267,76 +312,165 @@ class BasePredictor(ABC):
         n_splits = cv_params.get('n_splits', 5)
         cv = TimeSeriesSplit(n_splits=n_splits)
         
-        self._perform_cross_validation(X, y, cv, 'time_series')
+        self._perform_cross_validation(X, y, cv, 'time_series', n_jobs=cv_params.get('n_jobs', -1))
     
-    def _perform_cross_validation(self, X, y, cv, cv_method_name, groups=None):
+    @staticmethod
+    def _fused_metrics(y_true, y_pred):
+        """
+        Calculate R², MSE and MAE in a single pass over the residuals.
+
+        Follows sklearn's r2_score for constant targets (1.0 for a perfect fit, 0.0 otherwise).
+
+        Returns:
+            tuple: (r2, mse, mae)
+        """
+        residuals = np.asarray(y_true, dtype=np.float64) - y_pred
+        squared = residuals * residuals
+        mse = squared.mean()
+        mae = np.abs(residuals).mean()
+
+        ss_res = squared.sum()
+        ss_tot = ((y_true - y_true.mean()) ** 2).sum()
+        if ss_tot == 0:
+            r2 = 1.0 if ss_res == 0 else 0.0
+        else:
+            r2 = 1 - ss_res / ss_tot
+        return r2, mse, mae
+
+    def _get_fold_model_copy(self):
+        """Model copy for a fold that is fitted in parallel with other folds, limited to a single core."""
+        model = self._get_model_copy()
+        if hasattr(model, 'n_jobs'):
+            model.n_jobs = 1
+        return model
+
+    def _get_cv_splits(self, X, y, cv, cv_method_name, groups=None):
+        """
+        Get the (train_idx, test_idx) pairs of a cross-validator, reusing them across training runs.
+
+        The splits only depend on the cross-validator parameters, the groups and the number of samples,
+        so repeated training on the same data (e.g. comparing models or encodings) skips the splitting.
+
+        Returns:
+            list: (train_idx, test_idx) pairs as int32 arrays
+        """
+        key = (
+            cv_method_name,
+            repr(cv),  # includes n_splits, shuffle and random_state
+            joblib_hash(np.asarray(groups)) if groups is not None else None,
+            X.shape
+        )
+        cache = BasePredictor._split_cache
+        splits = cache.get(key)
+        if splits is None:
+            splits = [
+                (train_idx.astype(np.int32), test_idx.astype(np.int32))
+                for train_idx, test_idx in cv.split(X, y, groups)
+            ]
+            cache[key] = splits
+            while len(cache) > BasePredictor._split_cache_size:
+                cache.popitem(last=False)
+        else:
+            # The entry can be evicted by a training run in another session in the meantime
+            try:
+                cache.move_to_end(key)
+            except KeyError:
+                pass
+        return splits
+
+    def _perform_cross_validation(self, X, y, cv, cv_method_name, groups=None, n_jobs=-1):
         """Perform cross-validation and calculate metrics."""
-        r2_scores = []
-        mse_scores = []
-        mae_scores = []
-        predictions_all = []
-        actuals_all = []
-        
-        cv_iterator = cv.split(X, y, groups) if groups is not None else cv.split(X, y)
-        
-        for fold, (train_idx, test_idx) in enumerate(cv_iterator):
-            X_train_fold, X_test_fold = X.iloc[train_idx], X.iloc[test_idx]
-            y_train_fold, y_test_fold = y.iloc[train_idx], y.iloc[test_idx]
-            
-            # Scale if necessary
-            if self.scaler is not None:
-                scaler_fold = StandardScaler()
-                X_train_scaled = scaler_fold.fit_transform(X_train_fold)
-                X_test_scaled = scaler_fold.transform(X_test_fold)
-            else:
-                X_train_scaled = X_train_fold
-                X_test_scaled = X_test_fold
-            
-            # Train and predict
-            temp_model = self._get_model_copy()
-            temp_model.fit(X_train_scaled, y_train_fold)
-            y_pred = temp_model.predict(X_test_scaled)
-
-            # Store predictions and actuals for overall metrics
-            predictions_all.extend(y_pred)
-            actuals_all.extend(y_test_fold.values)
+        splits = self._get_cv_splits(X, y, cv, cv_method_name, groups)
+
+        # Fold metrics are written by fold index. R² is only kept for folds with more than one test sample
+        n_folds = len(splits)
+        r2_scores = np.empty(n_folds, dtype=np.float64)
+        mse_scores = np.empty(n_folds, dtype=np.float64)
+        mae_scores = np.empty(n_folds, dtype=np.float64)
+        r2_valid = np.zeros(n_folds, dtype=bool)
+        
+        # Row-major arrays make the fold slicing a cheap fancy index instead of a pandas lookup
+        X_values = np.ascontiguousarray(X)
+
+        # Test folds don't overlap, so predictions are written to their sample position. Samples that are
+        # never tested (e.g. the first block of a time series split) are masked out afterwards
+        predictions_all = np.empty(len(y))
+        tested = np.zeros(len(y), dtype=bool)
+
+        # The final model is trained as an additional fold on all samples
+        final_fold = (np.arange(len(y), dtype=np.int32), np.array([], dtype=np.int32))
+
+        # Folds are independent of each other, so they are fitted in parallel together with the final model.
+        # The cores go to the folds, so the fold models and the BLAS threads of the worker processes
+        # are limited to a single thread. Threads share the process, so only the models are limited for them
+        parallel_folds = effective_n_jobs(n_jobs) > 1
+        model_factory = self._get_fold_model_copy if parallel_folds else self._get_model_copy
+        if parallel_folds and self.cv_prefer == 'processes':
+            fold_config = parallel_config(backend='loky', inner_max_num_threads=1)
+        else:
+            fold_config = nullcontext()
+        with fold_config:
+            fold_results = Parallel(n_jobs=n_jobs, prefer=self.cv_prefer)(
+                delayed(_run_fold)(train_idx, test_idx, X_values, y, model_factory)
+                for train_idx, test_idx in [*splits, final_fold]
+            )
+        
+        # The compiled kernel needs contiguous float64 arrays
+        if NUMBA_AVAILABLE:
+            fold_metrics = _fused_metrics_numba
+            y_metrics = np.ascontiguousarray(y, dtype=np.float64)
+        else:
+            fold_metrics = self._fused_metrics
+            y_metrics = y
+
+        fold = 0
+        for y_pred, test_idx, fitted in fold_results:
+            if fitted is not None:
+                # The final model predicts with the configured number of cores again
+                if hasattr(fitted, 'n_jobs'):
+                    fitted.n_jobs = self.model.n_jobs
+                self.model = fitted
+                continue
+
+            # Store predictions for overall metrics
+            predictions_all[test_idx] = y_pred
+            tested[test_idx] = True
             
             # Calculate fold-specific metrics
-            mse_scores.append(mean_squared_error(y_test_fold, y_pred))
-            mae_scores.append(mean_absolute_error(y_test_fold, y_pred))
+            r2_scores[fold], mse_scores[fold], mae_scores[fold] = fold_metrics(
+                y_metrics[test_idx], np.ascontiguousarray(y_pred, dtype=np.float64)
+            )
 
-            # Only calculate R² if we have more than one sample in the test fold
-            if len(y_test_fold) > 1:
-                r2_fold = r2_score(y_test_fold, y_pred)
-                r2_scores.append(r2_fold)
+            # Only keep R² if we have more than one sample in the test fold
             # For single samples, we'll calculate overall R² later
+            r2_valid[fold] = len(test_idx) > 1
+            fold += 1
 
-        # Convert to numpy arrays for easier handling
-        predictions_all = np.array(predictions_all)
-        actuals_all = np.array(actuals_all)
+        r2_scores = r2_scores[r2_valid]
+
+        predictions_all = predictions_all[tested]
+        actuals_all = y[tested]
         
         # Calculate overall metrics across all predictions
-        overall_r2 = r2_score(actuals_all, predictions_all)
-        overall_mse = mean_squared_error(actuals_all, predictions_all)
-        overall_mae = mean_absolute_error(actuals_all, predictions_all)
+        overall_r2, overall_mse, overall_mae = self._fused_metrics(actuals_all, predictions_all)
         
         # Store cross-validation results
         self.cv_results = {
             'fold_mse_scores': mse_scores,
             'fold_mae_scores': mae_scores,
-            'fold_r2_scores': r2_scores if r2_scores else None,  # None if no fold had >1 sample
+            'fold_r2_scores': r2_scores if r2_scores.size else None,  # None if no fold had >1 sample
             'overall_predictions': predictions_all,
             'overall_actuals': actuals_all,
-            'n_folds': len(mse_scores)
+            'n_folds': n_folds
         }
         
         # Calculate summary metrics
         self.metrics = {
             'cv_method': cv_method_name,
-            'cv_mse_mean': np.mean(mse_scores),
-            'cv_mse_std': np.std(mse_scores),
-            'cv_mae_mean': np.mean(mae_scores),
-            'cv_mae_std': np.std(mae_scores),
+            'cv_mse_mean': mse_scores.mean(),
+            'cv_mse_std': mse_scores.std(),
+            'cv_mae_mean': mae_scores.mean(),
+            'cv_mae_std': mae_scores.std(),
             'overall_r2': overall_r2,  # R² calculated on all predictions vs actuals
             'overall_mse': overall_mse,
             'overall_mae': overall_mae,
@@ -345,10 +479,10 @@ class BasePredictor(ABC):
         }
 
         # Add fold-wise R² statistics only if available
-        if r2_scores:
+        if r2_scores.size:
             self.metrics.update({
-                'cv_r2_mean': np.mean(r2_scores),
-                'cv_r2_std': np.std(r2_scores),
+                'cv_r2_mean': r2_scores.mean(),
+                'cv_r2_std': r2_scores.std(),
                 'cv_r2_scores': r2_scores
             })
         else:
@@ -367,15 +501,18 @@ class BasePredictor(ABC):
         # data_clean = data.dropna(subset=[self.target_column] + self.feature_columns)
         X_encoded, _ = self._prepare_data(data, fit_encoders=False)
 
-        # Ensure columns match training data (add missing columns as zeros, drop extras)
-        X_encoded = X_encoded.reindex(columns=self.encoded_feature_names, fill_value=0)
-        
-        if self.scaler is not None:
-            X_scaled = self.scaler.transform(X_encoded)
-        else:
-            X_scaled = X_encoded
-        
-        predictions = self.model.predict(X_scaled)
+        # Impute missing numerical values with the training means
+        X_numerical = X_encoded[:, :len(self.numerical_columns)]
+        missing = np.isnan(X_numerical)
+        if missing.any():
+            imputed_columns = [self.numerical_columns[i] for i in np.flatnonzero(missing.any(axis=0))]
+            warnings.warn(
+                f"Imputed {missing.sum()} missing values in {imputed_columns} with the training means",
+                stacklevel=2
+            )
+            X_numerical[missing] = self._feature_means[np.nonzero(missing)[1]]
+        
+        predictions = self.model.predict(X_encoded)
         return predictions
     
     def get_metrics(self):
@@ -1,19 +1,53 @@
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import StandardScaler
+import numpy as np
+from scipy.linalg import lstsq
 
 from .base import BasePredictor
 
-class LinearRegressionPredictor(BasePredictor):
+class FastLinearRegression:
+    """
+    Ordinary least squares with intercept, solved directly with scipy's lstsq.
+
+    Equivalent to sklearn's LinearRegression for dense inputs, without its input validation overhead
+    on every cross-validation fold. lstsq returns the minimum norm solution, so the collinear
+    one-hot columns are handled the same way.
+    """
+
     def __init__(self):
-        super().__init__()
+        self.coef_ = None
+        self.intercept_ = None
+
+    def fit(self, X, y):
+        # Keep single precision inputs in single precision, everything else is solved in float64
+        X = np.asarray(X)
+        if X.dtype != np.float32:
+            X = X.astype(np.float64, copy=False)
+        y = np.asarray(y, dtype=X.dtype)
+
+        # Fit on centered data so that the intercept is not part of the least squares problem
+        X_mean = X.mean(axis=0)
+        y_mean = y.mean()
+        # Same singular value cutoff as sklearn, so rank deficient folds get the same solution
+        cond = max(X.shape) * np.finfo(X.dtype).eps
+        self.coef_, *_ = lstsq(X - X_mean, y - y_mean, cond=cond, lapack_driver='gelsd', check_finite=False)
+        self.intercept_ = y_mean - X_mean @ self.coef_
+        return self
+
+    def predict(self, X):
+        return np.asarray(X) @ self.coef_ + self.intercept_
+
+class LinearRegressionPredictor(BasePredictor):
+    def __init__(self, input_dtype=np.float64):
+        super().__init__(input_dtype=input_dtype)
         self._init_model()
 
     def _init_model(self):
-        self.model = LinearRegression()
-        self.scaler = StandardScaler()
+        # The features are not standardized. With an intercept this gives the same predictions for the
+        # training categories, but rows with unseen categories (all zero one-hot columns) can differ
+        # slightly, because the minimum norm solution of the collinear one-hot columns depends on the scaling
+        self.model = FastLinearRegression()
 
     def _get_model_copy(self):
-        return LinearRegression()
+        return FastLinearRegression()
 
 if __name__ == '__main__':
 
@@ -49,9 +83,12 @@ if __name__ == '__main__':
     field_data_clean['predictions'] = predictor.predict(field_data_clean)
     # print(field_data_clean)
 
-    plt.plot(field_data_clean[config['model']['target']], field_data_clean['predictions'], 'o')
+    plot_data = field_data_clean
+    if len(plot_data) > 5000:
+        plot_data = plot_data.sample(5000, random_state=0)
+    plt.scatter(plot_data[config['model']['target']], plot_data['predictions'], s=6, alpha=0.5, rasterized=True)
     plt.axline((0,0), slope=1, color = 'red')
     plt.xlabel('Actual Hours')
     plt.ylabel('Predicted Hours')
     plt.title('Actual vs. Predicted')
-    plt.savefig('predictions_linreg.png', dpi = 300)
\ No newline at end of file
+    plt.savefig('predictions_linreg.png', dpi = 150)
\ No newline at end of file
@@ -1,18 +1,43 @@
+import numpy as np
+from sklearn.base import clone
 from sklearn.ensemble import RandomForestRegressor
 
 from .base import BasePredictor
 
 class RandomForestPredictor(BasePredictor):
-    def __init__(self):
-        super().__init__()
+    # The tree building releases the GIL, so the folds can share the process
+    cv_prefer = 'threads'
+
+    def __init__(self, input_dtype=np.float32, n_jobs=-1,
+                 max_depth=None, min_samples_leaf=1, max_samples=None):
+        """
+        Args:
+            input_dtype: Defaults to float32, which the trees use internally, so the
+                feature matrix is not copied on every fit and predict
+            n_jobs (int): Number of cores used to build the trees and predict (-1 for all cores)
+            max_depth (int): Maximum depth of the trees (None grows them until the leaves are pure)
+            min_samples_leaf (int): Minimum number of samples in a leaf
+            max_samples (float): Fraction of the samples drawn to build each tree (None draws all samples)
+
+            The tree size limits default to the sklearn defaults. Smaller trees can be set through the
+            'model_params' of the model in config.yaml
+        """
+        super().__init__(input_dtype=input_dtype)
+        self.forest_params = {
+            'n_estimators': 100,
+            'random_state': 42,
+            'n_jobs': n_jobs,
+            'max_depth': max_depth,
+            'min_samples_leaf': min_samples_leaf,
+            'max_samples': max_samples
+        }
         self._init_model()
 
     def _init_model(self):
-        self.model = RandomForestRegressor(n_estimators=100, random_state=42)
-        self.scaler = None
+        self.model = RandomForestRegressor(**self.forest_params)
 
     def _get_model_copy(self):
-        return RandomForestRegressor(n_estimators=100, random_state=42)
+        return clone(self.model)
 
 if __name__ == '__main__':
 
@@ -48,9 +73,12 @@ if __name__ == '__main__':
     field_data_clean['predictions'] = predictor.predict(field_data_clean)
     print(field_data_clean)
 
-    plt.plot(field_data_clean[config['model']['target']], field_data_clean['predictions'], 'o')
+    plot_data = field_data_clean
+    if len(plot_data) > 5000:
+        plot_data = plot_data.sample(5000, random_state=0)
+    plt.scatter(plot_data[config['model']['target']], plot_data['predictions'], s=6, alpha=0.5, rasterized=True)
     plt.axline((0,0), slope=1, color = 'red')
     plt.xlabel('Actual Hours')
     plt.ylabel('Predicted Hours')
     plt.title('Actual vs. Predicted')
-    plt.savefig('predictions_randfor.png', dpi = 300)
\ No newline at end of file
+    plt.savefig('predictions_randfor.png', dpi = 150)
\ No newline at end of file
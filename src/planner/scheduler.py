@@ -17,7 +17,7 @@ def schedule_field_work(
     Parameters:
     - field_table: DataFrame with fields and their required hours. Must contain a column specified by 'group_name'
                    that contains variety group information (e.g., 'frühsorte', 'hauptsorte', 'spätsorte')
-    - workforce: Object with get_daily_work_hours(date) and get_daily_worker_count(date) methods
+    - workforce: Object with a to_arrays(start, end) method returning the dates, daily work hours and daily worker counts
     - start_date: Either:
                   * dict with datetime objects for each group in group_name (e.g., {'frühsorte': datetime(2025,8,24), 'hauptsorte': datetime(2025,9,17)})
                   * single datetime/date object for all groups (backward compatibility)
@@ -44,8 +44,9 @@ def schedule_field_work(
     )
     ```
     """
-    field_table = field_table.copy()
-    all_results = []
+    # field_table is only read, so no copy is needed
+    # Results are collected per column and turned into a DataFrame once at the end
+    results = {'Field': [], 'start_date': [], 'end_date': [], 'total_hours': [], 'Harvest round': [], 'Variety Group': []}
 
     # Handle single start_date for backward compatibility
     if not isinstance(start_date, dict):
@@ -61,8 +62,35 @@ def schedule_field_work(
             if isinstance(date_val, date) and not isinstance(date_val, datetime):
                 start_date_dict[group] = datetime.combine(date_val, time(hour=8))
 
-    # Group fields by variety group
-    grouped_fields = field_table.groupby(group_name)
+    if start_date_dict:
+        # Daily work hours and worker counts, indexed by the number of days since the first start date
+        calendar_start = min(start_date_dict.values()).date()
+        calendar_end = date(max(start.year for start in start_date_dict.values()), 12, 31)
+        _, daily_work_hours, daily_worker_counts = workforce.to_arrays(calendar_start, calendar_end)
+
+        # Check up front that the required hours fit into the workforce capacity until the end of the year.
+        # The fields that fit are still scheduled, the loop below stops at the end of the year
+        total_capacity = daily_work_hours[:(date(calendar_start.year, 12, 31) - calendar_start).days + 1].sum()
+        total_demand = field_table.loc[field_table[group_name].isin(start_date_dict), hours_column].sum()
+        if total_demand > total_capacity:
+            st.warning(
+                f'The fields require {total_demand:.0f} hours, but the workforce only provides {total_capacity:.0f} hours '
+                'until the end of the year. Please review the workforce or field requirements.'
+            )
+
+    def daily_capacity(day):
+        """Work hours and worker count on the given day, without capacity outside of the calendar"""
+        day_idx = (day - calendar_start).days
+        if 0 <= day_idx < len(daily_work_hours):
+            return daily_work_hours[day_idx], daily_worker_counts[day_idx]
+        return 0.0, 0.0
+
+    # Group fields by variety group and process the groups in the order of their start dates.
+    # Groups without a start date are warned about after the scheduled ones
+    grouped_fields = sorted(
+        field_table.groupby(group_name),
+        key=lambda item: (item[0] not in start_date_dict, start_date_dict.get(item[0], datetime.min))
+    )
 
     # Track the latest end time across all groups to avoid overlapping work
     global_current_datetime = None
@@ -74,6 +102,7 @@ def schedule_field_work(
             continue
 
         group_start_date = start_date_dict[group]
+        year_end = date(group_start_date.year, 12, 31)
 
         # Ensure we don't start before the global current time (to avoid overlapping work)
         if global_current_datetime is not None:
@@ -82,14 +111,13 @@ def schedule_field_work(
             current_datetime = group_start_date
 
         current_date = current_datetime.date()
-        remaining_daily_capacity = workforce.get_daily_work_hours(current_date)
-        daily_worker_count = workforce.get_daily_worker_count(current_date)
+        remaining_daily_capacity, daily_worker_count = daily_capacity(current_date)
 
         # The field_table is already ordered according to the harvest_round_order from apply_fields_config
-        for _, field_row in group_fields.iterrows():
-            field_name = field_row[field_order_column]
-            required_hours = field_row[hours_column]
-            harvest_round = field_row[harvest_round_column]
+        field_names = group_fields[field_order_column].to_numpy()
+        field_hours = group_fields[hours_column].to_numpy()
+        harvest_rounds = group_fields[harvest_round_column].to_numpy()
+        for field_name, required_hours, harvest_round in zip(field_names, field_hours, harvest_rounds):
             field_start = current_datetime
             remaining_hours = required_hours
 
@@ -97,16 +125,15 @@ def schedule_field_work(
                 # Check if we've moved to a new day
                 if current_datetime.date() != current_date:
                     current_date = current_datetime.date()
-                    remaining_daily_capacity = workforce.get_daily_work_hours(current_date)
-                    daily_worker_count = workforce.get_daily_worker_count(current_date)
+                    remaining_daily_capacity, daily_worker_count = daily_capacity(current_date)
 
                 if remaining_daily_capacity <= 0 or daily_worker_count == 0:
                     # No work capacity this day, move to next day
                     current_datetime = datetime.combine(current_date + timedelta(days=1), group_start_date.time())
                     # Safety exit to avoid infinite loop if no workers available anymore
-                    if current_datetime.timetuple().tm_yday == 365:
+                    if current_datetime.date() >= year_end:
                         st.warning('Could not finish all fields within the year. Please review the workforce or field requirements.')
-                        return pd.DataFrame(all_results)
+                        return pd.DataFrame(results)
 
                     continue
 
@@ -120,14 +147,12 @@ def schedule_field_work(
                 remaining_daily_capacity -= hours_to_work
 
             field_end = round_to_nearest_hour(current_datetime)
-            all_results.append({
-                'Field': field_name,
-                'start_date': field_start,
-                'end_date': field_end,
-                'total_hours': required_hours,
-                'Harvest round': harvest_round,
-                'Variety Group': group
-            })
+            results['Field'].append(field_name)
+            results['start_date'].append(field_start)
+            results['end_date'].append(field_end)
+            results['total_hours'].append(required_hours)
+            results['Harvest round'].append(harvest_round)
+            results['Variety Group'].append(group)
             print(f"Finished field {field_name} (round {harvest_round}) on {field_end}")
 
             # Use rounded end time as start for next field
@@ -136,15 +161,12 @@ def schedule_field_work(
         # Update global current time to the end of this group's work
         global_current_datetime = current_datetime
 
-    return pd.DataFrame(all_results)
+    return pd.DataFrame(results)
 
 def round_to_nearest_hour(dt):
     """Round a datetime object to the nearest hour."""
-    if dt.minute >= 30 or (dt.minute == 29 and dt.second >= 30):
-        dt = dt.replace(second=0, microsecond=0, minute=0) + timedelta(hours=1)
-    else:
-        dt = dt.replace(second=0, microsecond=0, minute=0)
-    return dt
+    # Rounds up from 29:30 past the hour, by comparing the seconds into the hour once instead of branching
+    return dt.replace(second=0, microsecond=0, minute=0) + timedelta(hours=dt.minute * 60 + dt.second >= 29 * 60 + 30)
 
 if __name__ == '__main__':
     from src.config import load_config
@@ -1,3 +1,4 @@
+import plotly.colors
 import plotly.graph_objects as go
 import pandas as pd
 import datetime
@@ -23,89 +24,98 @@ def create_timeline_chart(schedule_df: pd.DataFrame, current_date: datetime.date
         )
         return fig
 
-    fig = go.Figure()
-
-    # Create timeline bars
-    for idx, (i, row) in enumerate(schedule_df.iterrows()):
+    # Create timeline bars. The bars are drawn as one trace per color of the default color cycle,
+    # with None separating the segments, instead of one trace per field
+    colors = plotly.colors.qualitative.Plotly
+    bars = [dict(x=[], y=[], customdata=[]) for _ in colors]
+    annotations = []
+    n_rows = len(schedule_df)
+    for idx, (field, start_date, end_date, total_hours) in enumerate(zip(
+        schedule_df['Field'], schedule_df['start_date'], schedule_df['end_date'], schedule_df['total_hours']
+    )):
         # Calculate bar position using sequential index, not DataFrame index
-        y_pos = len(schedule_df) - idx - 1
-
-        # Create hover text
-        hover_text = (
-            f"<b>{row['Field']}</b><br>"
-            f"Start: {row['start_date']}<br>"
-            f"End: {row['end_date']}<br>"
-            f"Required Hours: {row['total_hours']}<br>"
-            #f"Days Needed: {row['days_needed']}<br>"
-            #f"Utilization: {row['worker_utilization']:.1f}%"
-        )
+        y_pos = n_rows - idx - 1
 
-        # Add timeline bar
-        fig.add_trace(go.Scatter(
-            x=[row['start_date'], row['end_date']],
-            y=[y_pos, y_pos],
-            mode='lines',
-            line=dict(width=20),
-            hovertemplate=hover_text + "<extra></extra>",
-            name=row['Field'],
-            showlegend=False
-        ))
+        bar = bars[idx % len(colors)]
+        bar['x'] += [start_date, end_date, None]
+        bar['y'] += [y_pos, y_pos, None]
+        bar['customdata'] += [(field, str(start_date), str(end_date), str(total_hours))] * 2 + [None]
 
-        # Add field name annotation
-        fig.add_annotation(
-            x=row['start_date'] + (row['end_date'] - row['start_date']) / 2,
+        # Field name annotation
+        annotations.append(dict(
+            x=start_date + (end_date - start_date) / 2,
             y=y_pos,
-            text=row['Field'],
+            text=field,
             showarrow=False,
             font=dict(color='white', size=10),
             bgcolor='rgba(0,0,0,0.5)',
             bordercolor='white',
             borderwidth=1
+        ))
+
+    # The figure is assembled from plain dicts, which skips plotly's per-property validation
+    traces = [
+        dict(
+            type='scatter',
+            **bar,
+            mode='lines',
+            line=dict(width=20, color=color),
+            hovertemplate=(
+                "<b>%{customdata[0]}</b><br>"
+                "Start: %{customdata[1]}<br>"
+                "End: %{customdata[2]}<br>"
+                "Required Hours: %{customdata[3]}<br>"
+                "<extra></extra>"
+            ),
+            showlegend=False
         )
+        for color, bar in zip(colors, bars) if bar['x']
+    ]
 
     # Add current date line
+    shapes = []
     if current_date:
-        fig.add_shape(
+        shapes.append(dict(
             type="line",
             x0=current_date,
             y0=0,
             x1=current_date,
-            y1=len(schedule_df),
+            y1=n_rows,
             line=dict(
                 color="red",
                 width=2,
                 dash="dash",
             )
-        )
+        ))
 
         # Add "Today" annotation
-        fig.add_annotation(
+        annotations.append(dict(
             x=current_date,
-            y=len(schedule_df),
+            y=n_rows,
             text="Today",
             showarrow=False,
             yshift=10
-        )
+        ))
 
-    # Update layout
-    fig.update_layout(
-        title="Field Work Timeline",
-        xaxis_title="Date",
-        yaxis_title="Fields",
+    layout = dict(
+        title=dict(text="Field Work Timeline"),
+        xaxis=dict(title=dict(text="Date"), showgrid=True),
         yaxis=dict(
+            title=dict(text="Fields"),
             tickmode='array',
-            tickvals=list(range(len(schedule_df))),
+            tickvals=list(range(n_rows)),
             ticktext=schedule_df['Field'].tolist()[::-1],  # Reverse order
             showgrid=True
         ),
-        xaxis=dict(showgrid=True),
-        height=max(400, len(schedule_df) * 50),
+        annotations=annotations,
+        shapes=shapes,
+        height=max(400, n_rows * 50),
         hovermode='closest',
         plot_bgcolor='white',
         paper_bgcolor='white'
     )
 
-    return fig
+    return go.Figure(data=traces, layout=layout, _validate=False)
 
 def create_predictions_scatterplot(
         df, 
@@ -126,7 +136,8 @@ def create_predictions_scatterplot(
         year_col (str): Name of the year column.
     """
     # Scatter plot
-    scatter = go.Scatter(
+    scatter = dict(
+        type='scatter',
         x=df[obs_col],
         y=df[pred_col],
         mode='markers',
@@ -143,7 +154,8 @@ def create_predictions_scatterplot(
     # 1:1 line
     min_val = min(df[obs_col].min(), df[pred_col].min())
     max_val = max(df[obs_col].max(), df[pred_col].max())
-    line = go.Scatter(
+    line = dict(
+        type='scatter',
         x=[min_val, max_val],
         y=[min_val, max_val],
         mode='lines',
@@ -151,12 +163,13 @@ def create_predictions_scatterplot(
         name='1:1 Line'
     )
     
-    layout = go.Layout(
-        title='Observed vs Predicted',
-        xaxis=dict(title=obs_col),
-        yaxis=dict(title=pred_col),
+    layout = dict(
+        title=dict(text='Observed vs Predicted'),
+        xaxis=dict(title=dict(text=obs_col)),
+        yaxis=dict(title=dict(text=pred_col)),
         showlegend=True
     )
     
-    fig = go.Figure(data=[scatter, line], layout=layout)
+    # Plain dicts skip plotly's per-property validation
+    fig = go.Figure(data=[scatter, line], layout=layout, _validate=False)
     return fig
\ No newline at end of file
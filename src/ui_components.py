@@ -1,7 +1,4 @@
 import streamlit as st
-import pandas as pd
-
-from datetime import datetime
 
 def render_sidebar(config):
     """Render the sidebar with current configuration settings.
@@ -12,47 +9,75 @@ def render_sidebar(config):
     Args:
         config (dict): The configuration dictionary loaded from config.yaml
     """
+    # Fragments can't write to the sidebar themselves, so the fragment is called inside it
     with st.sidebar:
-        st.title("Current Settings")
-        
-        # General Settings Section
-        st.subheader("General Settings")
-        st.info(f"**Year:** {config.get('year', 'Not set')}")
-        st.info(f"**Model:** {config.get('param_name', 'Not set')}")
-
-        start_date = config.get('start_date', {})
-        st.subheader(f"**Start Dates:**")
-        for group, date in start_date.items():
-            st.info(f"**{group.capitalize()}:** {date}")
-        
-        # Google Sheets Section
-        if 'gsheets' in config:
-            with st.expander("Google Sheets"):
-                st.write(f"**Worksheet:** {config['gsheets'].get('worksheet_name', 'Not set')}")
-                
-                # Show truncated URL for better display
-                url = config['gsheets'].get('spreadsheet_url', '')
-                if url:
-                    display_url = url[:30] + '...' if len(url) > 30 else url
-                    st.write(f"**URL:** {display_url}")
-        
-        # Model Information Section
-        model_name = config.get('param_name')
-        if model_name and model_name in config:
-            with st.expander(f"{model_name} Model Details"):
-                # Show target
-                st.write(f"**Target:** {config['models'][model_name].get('target', 'Not set')}")
-                
-                # Show predictors in a compact way
-                predictors = config['models'][model_name].get('predictors', [])
-                if predictors:
-                    st.write("**Predictors:**")
-                    for pred in predictors:
-                        st.write(f"- {pred}")
-                
-                # Show CV method
-                st.write(f"**CV Method:** {config['models'][model_name].get('cv_method', 'Not set')}")
-        
-        # Add a link to the settings page
-        st.divider()
-        st.write("Need to change settings? [Go to Settings Page](/Settings)")
+        _render_sidebar_content(config)
+
+@st.cache_data(show_spinner=False)
+def _sidebar_view(config):
+    """Markdown strings shown in the sidebar, derived once per config instead of on every rerun."""
+    view = {
+        'general_md': f"**Year:** {config.get('year', 'Not set')}\n\n**Model:** {config.get('param_name', 'Not set')}",
+        'start_dates_md': "\n\n".join(f"**{group.capitalize()}:** {date}" for group, date in config.get('start_date', {}).items()),
+        'gsheets_md': None,
+        'model_md': None
+    }
+
+    # Google Sheets Section
+    if 'gsheets' in config:
+        lines = [f"**Worksheet:** {config['gsheets'].get('worksheet_name', 'Not set')}"]
+
+        # Show truncated URL for better display
+        url = config['gsheets'].get('spreadsheet_url', '')
+        if url:
+            display_url = url[:30] + '...' if len(url) > 30 else url
+            lines.append(f"**URL:** {display_url}")
+        view['gsheets_md'] = "\n\n".join(lines)
+
+    # Model Information Section
+    model_name = config.get('param_name')
+    if model_name and model_name in config:
+        # Show target
+        lines = [f"**Target:** {config['models'][model_name].get('target', 'Not set')}"]
+
+        # Show predictors in a compact way
+        predictors = config['models'][model_name].get('predictors', [])
+        if predictors:
+            lines.append("**Predictors:**\n" + "\n".join(f"- {pred}" for pred in predictors))
+
+        # Show CV method
+        lines.append(f"**CV Method:** {config['models'][model_name].get('cv_method', 'Not set')}")
+        view['model_md'] = "\n\n".join(lines)
+
+    return view
+
+@st.fragment
+def _render_sidebar_content(config):
+    """Sidebar content, rendered as a fragment so that it can rerun independently of the page."""
+    view = _sidebar_view(config)
+    st.title("Current Settings")
+
+    # Each section is rendered as a single element instead of one element per line
+    # General Settings Section
+    st.subheader("General Settings")
+    st.info(view['general_md'])
+
+    st.subheader(f"**Start Dates:**")
+    if view['start_dates_md']:
+        st.info(view['start_dates_md'])
+
+    # Detail sections are only shown when toggled open, unlike expanders which always render their content
+    # Google Sheets Section
+    if view['gsheets_md'] and st.toggle("Google Sheets", key="show_gsheets"):
+        with st.container(border=True):
+            st.markdown(view['gsheets_md'])
+
+    # Model Information Section
+    model_name = config.get('param_name')
+    if view['model_md'] and st.toggle(f"{model_name} Model Details", key="show_model_details"):
+        with st.container(border=True):
+            st.markdown(view['model_md'])
+
+    # Add a link to the settings page
+    st.divider()
+    st.write("Need to change settings? [Go to Settings Page](/Settings)")
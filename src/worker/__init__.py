@@ -1,2 +1,2 @@
 from .worker import Worker
-from .workforce import Workforce
\ No newline at end of file
+from .workforce import Workforce, WorkforceLoadError
\ No newline at end of file
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 import datetime
+import numpy as np
 
 # from .workforce import Workforce
 
@@ -25,3 +26,8 @@ class Worker(BaseModel):
             return self.work_hours
         return 0
 
+    def hours_over_range(self, start, end):
+        """Daily work hours for every day from start to end (inclusive), matching get_daily_work_hours"""
+        dates = np.arange(np.datetime64(start, 'D'), np.datetime64(end, 'D') + 1)
+        active = (dates >= np.datetime64(self.start_date.date())) & (dates <= np.datetime64(self.end_date.date()))
+        return np.where(active, self.work_hours, 0.0)
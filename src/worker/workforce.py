@@ -1,34 +1,65 @@
 import yaml
+import numpy as np
 import streamlit as st
 
 from pathlib import Path
+from pydantic import TypeAdapter
+
+from .worker import Worker
+
+# Use the libyaml bindings when available, they are much faster than the pure Python implementation
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Validator and serializer for a list of workers, shared by save and load
+_workers_adapter = TypeAdapter(list[Worker])
+
+class WorkforceLoadError(Exception):
+    """Raised when a workforce file exists but can't be read or validated"""
 
 class Workforce:
     def __init__(self):
-        self.workers = []
+        # Workers by name. Dicts keep insertion order, so this also defines the order of the workers
+        self._by_name = {}
+
+    @property
+    def workers(self):
+        return list(self._by_name.values())
 
     def add_worker(self, worker):
-        if worker.name in [w.name for w in self.workers]:
+        if worker.name in self._by_name:
             raise ValueError(f"Worker with name '{worker.name}' already exists in the workforce.")
-        self.workers.append(worker)
+        self._by_name[worker.name] = worker
 
     def get_workers(self):
         return self.workers
 
     def update_worker(self, name, worker):
-        for i, w in enumerate(self.workers):
-            if w.name == name:
-                # Replace the worker at the same position to maintain order
-                self.workers[i] = worker
-                return
-        raise ValueError(f"Worker with name '{name}' not found in the workforce.")
+        if name not in self._by_name:
+            raise ValueError(f"Worker with name '{name}' not found in the workforce.")
+
+        if worker.name == name:
+            self._by_name[name] = worker
+            return
+
+        if worker.name in self._by_name:
+            raise ValueError(f"Worker with name '{worker.name}' already exists in the workforce.")
+        # Renamed workers are replaced at the same position to maintain order
+        self._by_name = {
+            (worker.name if key == name else key): (worker if key == name else w)
+            for key, w in self._by_name.items()
+        }
 
     def remove_worker(self, name):
-        for i, w in enumerate(self.workers):
-            if w.name == name:
-                self.workers.pop(i)
-                return
-        raise ValueError(f"Worker with name '{name}' not found in the workforce.")
+        if name not in self._by_name:
+            raise ValueError(f"Worker with name '{name}' not found in the workforce.")
+        del self._by_name[name]
+
+    def key(self):
+        """Hashable snapshot of the workers, used to cache results computed from this workforce"""
+        return tuple(worker.model_dump_json() for worker in self.workers)
 
     def get_daily_work_hours(self, date):
         total_hours = 0
@@ -49,39 +80,69 @@ class Workforce:
         worker_count = sum([i.work_hours / max_hours_on_date for i in workers_on_date])
         return worker_count
 
-    def save(self, filename='workers.yaml'):
-        # Convert Pydantic models to dictionaries, excluding the workforce field
-        workers_data = [worker.model_dump(exclude={'workforce'}) for worker in self.workers]
+    def to_arrays(self, start, end):
+        """
+        Daily work hours and worker count for every day from start to end (inclusive), as aligned arrays.
 
+        Returns:
+            tuple: (dates, work_hours, worker_count) where dates is a datetime64[D] array and the
+                values match get_daily_work_hours and get_daily_worker_count for each day
+        """
+        dates = np.arange(np.datetime64(start, 'D'), np.datetime64(end, 'D') + 1)
+        if not self.workers:
+            return dates, np.zeros(len(dates)), np.zeros(len(dates))
+
+        # One row of daily hours per worker
+        worker_hours = np.stack([worker.hours_over_range(start, end) for worker in self.workers])
+
+        work_hours = worker_hours.sum(axis=0)
+
+        # Workers are weighted by their hours relative to the longest working worker of the day
+        max_hours = worker_hours.max(axis=0)
+        worker_count = np.divide(
+            worker_hours, max_hours, out=np.zeros_like(worker_hours), where=max_hours > 0
+        ).sum(axis=0)
+        return dates, work_hours, worker_count
+
+    def save(self, filename='workers.yaml'):
+        """Save workers to YAML, or to JSON if the filename ends with .json (faster for large workforces)"""
         Path(filename).parent.mkdir(parents=True, exist_ok=True)
 
+        if Path(filename).suffix == '.json':
+            # Serialized directly by pydantic, without building intermediate dictionaries
+            Path(filename).write_bytes(_workers_adapter.dump_json(self.workers, indent=2))
+            return
+
+        # Convert Pydantic models to dictionaries in a single pass over the list
+        workers_data = _workers_adapter.dump_python(self.workers)
+
         # Save to YAML file
         with open(filename, 'w') as file:
-            yaml.dump(workers_data, file, default_flow_style=False, indent=2)
+            yaml.dump(workers_data, file, Dumper=SafeDumper, default_flow_style=False, indent=2)
     
     def load(self, filename='workers.yaml'):
-        """Load workers from a YAML file"""
-        from .worker import Worker  # Import here to avoid circular imports
-        
+        """Load workers from a YAML or JSON file, selected by the file extension"""
         try:
-            with open(filename, 'r') as file:
-                workers_data = yaml.safe_load(file)
+            if Path(filename).suffix == '.json':
+                workers = _workers_adapter.validate_json(Path(filename).read_bytes())
+            else:
+                # The whole file is passed to the loader as bytes, so it doesn't read through a text file wrapper
+                workers_data = yaml.load(Path(filename).read_bytes(), Loader=SafeLoader)
+                # Create Worker instances from the loaded data, validated with a single list validator
+                # instead of one Worker(...) call per entry
+                workers = _workers_adapter.validate_python(workers_data)
                 
-            # Clear existing workers
-            self.workers = []
-            
-            # Create Worker instances from the loaded data
-            for worker_data in workers_data:
-                # Remove the workforce field from data since it will be set automatically
-                worker_data_copy = worker_data.copy()
-               
-                # Create worker with this workforce instance
-                worker = Worker(**worker_data_copy)
-                self.add_worker(worker)
+            # Build the new workers dict first and replace the existing workers at once,
+            # so that a duplicate name doesn't leave a partially loaded workforce
+            by_name = {}
+            for worker in workers:
+                if worker.name in by_name:
+                    raise ValueError(f"Worker with name '{worker.name}' already exists in the workforce.")
+                by_name[worker.name] = worker
+            self._by_name = by_name
                 
         except FileNotFoundError:
             st.warning(f"File {filename} not found. Starting with empty workforce.")
-            self.workers = []
+            self._by_name = {}
         except Exception as e:
-            st.error(f"Error loading workers from {filename}: {e}")
-            st.stop()
\ No newline at end of file
+            raise WorkforceLoadError(f"Error loading workers from {filename}: {e}") from e
@@ -0,0 +1,39 @@
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from src.model import LinearRegressionPredictor
+
+
+class PredictMissingValuesTest(unittest.TestCase):
+    def setUp(self):
+        self.data = pd.DataFrame({
+            'Area': [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            'Variety': ['Gala', 'Fuji', 'Gala', 'Fuji', 'Gala', 'Fuji'],
+            'Hours': [10.0, 25.0, 30.0, 45.0, 50.0, 65.0]
+        })
+        self.predictor = LinearRegressionPredictor()
+        self.predictor.train(self.data, 'Hours', ['Area', 'Variety'])
+
+    def test_missing_numerical_values_are_imputed_with_training_means(self):
+        data = self.data.iloc[:2].copy()
+        data.loc[data.index[0], 'Area'] = np.nan
+
+        with self.assertWarnsRegex(UserWarning, r"Imputed 1 missing values in \['Area'\]"):
+            predictions = self.predictor.predict(data)
+
+        expected = data.copy()
+        expected.loc[expected.index[0], 'Area'] = self.data['Area'].mean()
+        np.testing.assert_allclose(predictions, self.predictor.predict(expected))
+        self.assertFalse(np.isnan(predictions).any())
+
+    def test_complete_data_does_not_warn(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            self.predictor.predict(self.data)
+
+
+if __name__ == '__main__':
+    unittest.main()